@@ -0,0 +1,45 @@
+"""Benchmark: per-call latency of validators, before and after the precompiled
+pattern registry.
+
+    python -m benchmarks.bench_re_pattern
+"""
+
+import re
+import timeit
+
+from src.handy import re_pattern
+
+SAMPLES: dict[str, str] = {
+    'float_number': '-12.345',
+    'ipv4': '192.168.100.200',
+    'email': 'someone.else@example.com',
+    'rgb_hex': '#A0B1C2',
+    'wx_id': 'wx_abc-123',
+    'qq_id': '123456789',
+    'phone_cn': '13800000000',
+    'id_cn': '43000000000000000X',
+    'license_plate_hk': 'AB1234',
+}
+
+
+def _old(s: str, pattern: str, flags: int = 0) -> bool:
+    return re.match(r'(' + pattern + r')$', s, flags=flags) is not None
+
+
+def main(number: int = 200_000) -> None:
+    re.purge()
+    re_pattern.warm_patterns()
+    print(f'{"pattern":<20}{"before (ns)":>14}{"after (ns)":>14}{"speedup":>10}')
+    for name, s in SAMPLES.items():
+        pattern, flags = re_pattern.PATTERNS[name]
+        before = timeit.timeit(lambda: _old(s, pattern, flags), number=number)
+        p = re_pattern.get_pattern(name)
+        after = timeit.timeit(lambda: p.fullmatch(s), number=number)
+        print(
+            f'{name:<20}{before / number * 1e9:>14.0f}'
+            f'{after / number * 1e9:>14.0f}{before / after:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
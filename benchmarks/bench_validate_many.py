@@ -0,0 +1,33 @@
+"""Benchmark: batch validation with `validate_many()` vs. a per-item loop.
+
+    python -m benchmarks.bench_validate_many
+"""
+
+import random
+import time
+
+from src.handy import validate_many, validate_phone_cn
+
+
+def main(n: int = 1_000_000) -> None:
+    random.seed(0)
+    values = [
+        random.choice(('138', '111', '186', '177')) + f'{random.randrange(10**8):08d}'
+        for _ in range(n)
+    ]
+
+    start = time.perf_counter()
+    loop = bytearray(validate_phone_cn(s) for s in values)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = validate_many(values, 'phone_cn')
+    batch_time = time.perf_counter() - start
+
+    assert loop == batch
+    print(f'per-item loop: {loop_time:.3f}s ({n / loop_time / 1e6:.2f}M/s)')
+    print(f'validate_many: {batch_time:.3f}s ({n / batch_time / 1e6:.2f}M/s)')
+
+
+if __name__ == '__main__':
+    main()
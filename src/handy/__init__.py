@@ -2,6 +2,8 @@
 
 from ._handy import (
     LocalMapReduce,
+    classify,
+    classify_many,
     find_chinese_characters,
     ispunctuation,
     validate_domain_name,
@@ -11,6 +13,7 @@ from ._handy import (
     validate_id_cn,
     validate_ipv4,
     validate_license_plate,
+    validate_many,
     validate_password_strength,
     validate_phone_cn,
     validate_qq_id,
@@ -35,7 +38,10 @@ __all__ = [
     'validate_qq_id',
     'validate_phone_cn',
     'validate_id_cn',
+    'validate_many',
     'ispunctuation',
+    'classify',
+    'classify_many',
 ]
 
 LOGGER_NAME = 'handy'
@@ -1,24 +1,23 @@
 import multiprocessing
 import re
 import string
+from array import array
 from collections import defaultdict
-from collections.abc import Callable, ItemsView, Iterator
+from collections.abc import Callable, ItemsView, Iterable, Iterator
+from functools import lru_cache
 from typing import Any, Literal, Union
 
 from .re_pattern import (
     CN_CHAR,
     DOMAIN_NAMES,
-    EMAIL,
-    FLOAT_NUMBER,
-    HTML,
-    ID_CN,
+    FIRST_CHARS,
     LANGUAGE,
-    LICENSE_PLATES,
-    PHONE_CN,
-    QQ_ID,
-    RGB_HEX,
-    WX_ID,
-    IPv4,
+    MAX_LENGTHS,
+    PATTERNS,
+    TokenType,
+    compile_classifier,
+    compile_pattern,
+    get_pattern,
 )
 
 
@@ -32,36 +31,35 @@ def find_chinese_characters(
 
 def validate_float_number(s: str) -> bool:
     """Float number validator."""
-    return _validate_by_regex(s, FLOAT_NUMBER)
+    return get_pattern('float_number').fullmatch(s) is not None
 
 
 def validate_ipv4(s: str) -> bool:
     """IPv4 addresses validator."""
-    return _validate_by_regex(s, IPv4)
+    return get_pattern('ipv4').fullmatch(s) is not None
 
 
 def validate_email(s: str) -> bool:
     """Email address validator."""
-    return _validate_by_regex(s, EMAIL, re.IGNORECASE)
+    return get_pattern('email').fullmatch(s) is not None
 
 
 def validate_html(s: str) -> bool:
     """HTML elements or tags validator."""
-    return _validate_by_regex(s, HTML, re.IGNORECASE | re.DOTALL)
+    return get_pattern('html').fullmatch(s) is not None
 
 
 def validate_domain_name(s: str, language: LANGUAGE = LANGUAGE.EN) -> bool:
     """Domain name validator."""
-    dn = DOMAIN_NAMES[language]
-    m = re.match(r'(' + dn[0] + r')$', s, re.IGNORECASE)
+    m = get_pattern('domain_name_' + language.value).fullmatch(s)
     if m:
-        return len(s) <= dn[1]
+        return len(s) <= DOMAIN_NAMES[language][1]
     return False
 
 
 def validate_rgb_hex(s: str) -> bool:
     """Color RGB hex validator."""
-    return _validate_by_regex(s, RGB_HEX, re.IGNORECASE)
+    return get_pattern('rgb_hex').fullmatch(s) is not None
 
 
 def validate_password_strength(s: str, min_len: int) -> bool:
@@ -71,38 +69,137 @@ def validate_password_strength(s: str, min_len: int) -> bool:
     """
     if min_len < 2:
         raise ValueError('minimal length of password must greater than 1')
-    m = re.match(
+    return _validate_by_regex(
+        s,
         r'.*(?=.{'
         + str(min_len)
-        + r',})(?=.*\d)(?=.*[A-Z])(?=.*[a-z])(?=.*[!@#$%^&*? ]).*$',
-        s,
+        + r',})(?=.*\d)(?=.*[A-Z])(?=.*[a-z])(?=.*[!@#$%^&*? ]).*',
     )
-    return m is not None
 
 
 def validate_license_plate(s: str, region: Literal['cn', 'hk']) -> bool:
     """License plate validator."""
-    return _validate_by_regex(s, LICENSE_PLATES[region])
+    return get_pattern('license_plate_' + region).fullmatch(s) is not None
 
 
 def validate_wx_id(s: str) -> bool:
     """Wechat(Wexin) ID validator."""
-    return _validate_by_regex(s, WX_ID)
+    return get_pattern('wx_id').fullmatch(s) is not None
 
 
 def validate_qq_id(s: str) -> bool:
     """QQ ID validator."""
-    return _validate_by_regex(s, QQ_ID)
+    return get_pattern('qq_id').fullmatch(s) is not None
 
 
 def validate_phone_cn(s: str) -> bool:
     """Chinese phone number validator."""
-    return _validate_by_regex(s, PHONE_CN)
+    return get_pattern('phone_cn').fullmatch(s) is not None
 
 
 def validate_id_cn(s: str) -> bool:
     """Chinese ID validator."""
-    return _validate_by_regex(s, ID_CN)
+    return get_pattern('id_cn').fullmatch(s) is not None
+
+
+def validate_many(values: Iterable[str], kind: str) -> Any:
+    """Validate `values` in batch with the pattern registered as `kind` in
+    `re_pattern.PATTERNS`.
+
+    Returns a mask of booleans (`1`/`0`) as `bytearray`, or as NumPy `bool` array
+    if `values` is a NumPy array.
+    """
+    fullmatch = get_pattern(kind).fullmatch
+    if kind in MAX_LENGTHS:
+        max_len = MAX_LENGTHS[kind]
+        mask = bytearray(
+            len(s) <= max_len and fullmatch(s) is not None for s in values
+        )
+    else:
+        mask = bytearray(map(bool, map(fullmatch, values)))
+
+    if type(values).__module__ == 'numpy':
+        import numpy
+
+        return numpy.frombuffer(mask, dtype=numpy.bool_)
+    return mask
+
+
+def classify(token: str, kinds: tuple[str, ...] = tuple(PATTERNS)) -> TokenType:
+    """Classify `token` against the patterns registered as `kinds` in
+    `re_pattern.PATTERNS` in one scan.
+
+    Returns the bitmask of all the matched types, as a token may be ambiguous
+    (e.g. `'12345'` is both `TokenType.QQ_ID` and `TokenType.FLOAT_NUMBER`).
+    """
+    return TokenType(_classify(kinds)(token))
+
+
+def classify_many(
+    tokens: Iterable[str], kinds: tuple[str, ...] = tuple(PATTERNS)
+) -> 'array[int]':
+    """Classify `tokens` in batch, see `classify()`.
+
+    Returns the bitmasks as `array('H')`.
+    """
+    return array('H', map(_classify(kinds), tokens))
+
+
+@lru_cache(maxsize=None)
+def _classify(kinds: tuple[str, ...]) -> Callable[[str], int]:
+    """Build the classifier function of `kinds`.
+
+    Tokens are dispatched on their first character to the classifier of only
+    the kinds that may start with it (see `re_pattern.FIRST_CHARS`).
+    """
+    first_chars = [
+        (kind, compile_pattern(FIRST_CHARS[kind], PATTERNS[kind][1]).fullmatch)
+        for kind in kinds
+    ]
+
+    @lru_cache(maxsize=4096)
+    def _dispatch(c: str) -> Callable[[str], int]:
+        return _classify_exactly(tuple(kind for kind, m in first_chars if m(c)))
+
+    def _classifier(token: str) -> int:
+        return _dispatch(token[:1])(token)
+
+    return _classifier
+
+
+@lru_cache(maxsize=None)
+def _classify_exactly(kinds: tuple[str, ...]) -> Callable[[str], int]:
+    """Build the classifier function running all patterns of `kinds`."""
+    if not kinds:
+        return lambda token: 0
+
+    p = compile_classifier(kinds)
+    match = p.match
+    groups = [(p.groupindex[kind], TokenType[kind.upper()].value) for kind in kinds]
+    # Too long tokens are never run through the patterns of length-limited kinds
+    # (e.g. domain names, which backtrack heavily on long inputs).
+    max_len = min(
+        (MAX_LENGTHS[kind] for kind in kinds if kind in MAX_LENGTHS), default=-1
+    )
+
+    def _classifier(token: str) -> int:
+        if 0 <= max_len < len(token):
+            return _classify_exactly(
+                tuple(
+                    kind
+                    for kind in kinds
+                    if kind not in MAX_LENGTHS or len(token) <= MAX_LENGTHS[kind]
+                )
+            )(token)
+
+        regs = match(token).regs  # type: ignore[union-attr]
+        mask = 0
+        for i, bit in groups:
+            if regs[i][0] >= 0:
+                mask |= bit
+        return mask
+
+    return _classifier
 
 
 def ispunctuation(s: str) -> bool:
@@ -180,5 +277,4 @@ class LocalMapReduce:
 
 def _validate_by_regex(s: str, pattern: str, flags: int = 0) -> bool:
     """Validator by Regex."""
-    m = re.match(r'(' + pattern + r')$', s, flags=flags)
-    return m is not None
+    return compile_pattern(pattern, flags).fullmatch(s) is not None
@@ -1,6 +1,8 @@
 """Regular expression patterns."""
 
-from enum import Enum, IntEnum
+import re
+from enum import Enum, IntEnum, IntFlag
+from functools import lru_cache
 from typing import Final, Literal
 
 # 浮点数
@@ -89,3 +91,110 @@ PHONE_CN: Final[str] = (
 
 # 中国身份证号码正则表达式，15-18位数字，最后一位是校验位，可能为数字或字符X
 ID_CN: Final[str] = r'\d{15}$)|(^\d{18}$)|(^\d{17}(\d|X|x)'
+
+
+# 校验器的模式注册表：名称 -> (正则表达式, 标志)
+PATTERNS: Final[dict[str, tuple[str, int]]] = {
+    'float_number': (FLOAT_NUMBER, 0),
+    'ipv4': (IPv4, 0),
+    'email': (EMAIL, re.IGNORECASE),
+    'html': (HTML, re.IGNORECASE | re.DOTALL),
+    'domain_name_en': (DOMAIN_NAMES[LANGUAGE.EN][0], re.IGNORECASE),
+    'domain_name_cn': (DOMAIN_NAMES[LANGUAGE.CN][0], re.IGNORECASE),
+    'rgb_hex': (RGB_HEX, re.IGNORECASE),
+    'license_plate_cn': (LICENSE_PLATES['cn'], 0),
+    'license_plate_hk': (LICENSE_PLATES['hk'], 0),
+    'wx_id': (WX_ID, 0),
+    'qq_id': (QQ_ID, 0),
+    'phone_cn': (PHONE_CN, 0),
+    'id_cn': (ID_CN, 0),
+}
+
+
+# 有长度限制的模式：名称 -> 最大长度
+MAX_LENGTHS: Final[dict[str, int]] = {
+    'domain_name_en': DOMAIN_NAMES[LANGUAGE.EN][1],
+    'domain_name_cn': DOMAIN_NAMES[LANGUAGE.CN][1],
+}
+
+# 各模式首字符的字符集（用于分派）：名称 -> 正则表达式
+FIRST_CHARS: Final[dict[str, str]] = {
+    'float_number': r'[-\d]',
+    'ipv4': r'\d',
+    'email': r'\w',
+    'html': r'<',
+    'domain_name_en': r'[a-zA-Z0-9]',
+    'domain_name_cn': r'[a-zA-Z0-9\u4E00-\u9FA5]',
+    'rgb_hex': r'#',
+    'license_plate_cn': LICENSE_PLATES['cn'][: LICENSE_PLATES['cn'].index(']') + 1],
+    'license_plate_hk': r'[A-Z]',
+    'wx_id': r'[a-zA-Z]',
+    'qq_id': r'[1-9]',
+    'phone_cn': r'1',
+    'id_cn': r'\d',
+}
+
+
+class TokenType(IntFlag):
+    """Bit flags of the patterns registered in `PATTERNS`, named in upper case."""
+
+    FLOAT_NUMBER = 1 << 0
+    IPV4 = 1 << 1
+    EMAIL = 1 << 2
+    HTML = 1 << 3
+    DOMAIN_NAME_EN = 1 << 4
+    DOMAIN_NAME_CN = 1 << 5
+    RGB_HEX = 1 << 6
+    LICENSE_PLATE_CN = 1 << 7
+    LICENSE_PLATE_HK = 1 << 8
+    WX_ID = 1 << 9
+    QQ_ID = 1 << 10
+    PHONE_CN = 1 << 11
+    ID_CN = 1 << 12
+
+
+_compiled_patterns: dict[str, re.Pattern[str]] = {}
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile `pattern` once, to be used with `re.Pattern.fullmatch()`.
+
+    Unlike `re.compile()`, the cache is unbounded, so it never thrashes.
+    """
+    return re.compile(r'(' + pattern + r')', flags)
+
+
+def get_pattern(name: str) -> re.Pattern[str]:
+    """Get the compiled pattern registered in `PATTERNS` by `name`, compiling it
+    lazily on first use."""
+    try:
+        return _compiled_patterns[name]
+    except KeyError:
+        pattern, flags = PATTERNS[name]
+        p = _compiled_patterns[name] = compile_pattern(pattern, flags)
+        return p
+
+
+def warm_patterns() -> None:
+    """Compile all patterns registered in `PATTERNS` eagerly."""
+    for name in PATTERNS:
+        get_pattern(name)
+
+
+@lru_cache(maxsize=None)
+def compile_classifier(names: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile the patterns registered as `names` into one pattern, where each one
+    is an optional lookahead capturing a named group (its name) when the whole
+    string matches it, so that one `re.Pattern.match()` tells all matched names.
+    """
+    parts = []
+    for name in names:
+        pattern, flags = PATTERNS[name]
+        scoped = ''.join(
+            c for f, c in ((re.IGNORECASE, 'i'), (re.DOTALL, 's')) if flags & f
+        )
+        if scoped:
+            pattern = r'(?' + scoped + r':' + pattern + r')'
+        parts.append(r'(?:(?=(?P<' + name + r'>(' + pattern + r'))\Z))?')
+    return re.compile(''.join(parts))
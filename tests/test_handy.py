@@ -7,6 +7,8 @@ import pytest
 
 from src.handy import (
     LocalMapReduce,
+    classify,
+    classify_many,
     find_chinese_characters,
     ispunctuation,
     re_pattern,
@@ -17,6 +19,7 @@ from src.handy import (
     validate_id_cn,
     validate_ipv4,
     validate_license_plate,
+    validate_many,
     validate_password_strength,
     validate_phone_cn,
     validate_qq_id,
@@ -574,6 +577,83 @@ class TestHandy:
             # not match
             assert not result
 
+    @pytest.mark.parametrize(
+        ('values', 'kind', 'expected'),
+        (
+            (['13800000000', '11100000000', ''], 'phone_cn', b'\x01\x00\x00'),
+            (iter(['12345', 'a1234']), 'qq_id', b'\x01\x00'),
+            (('abc.org', 'abc.d'), 'domain_name_en', b'\x01\x00'),
+            (['纯中文.中文', 'abc.dd'], 'domain_name_cn', b'\x01\x00'),
+            ([], 'email', b''),
+        ),
+    )
+    def test_validate_many(self, values: list[str], kind: str, expected: bytes):
+        result = validate_many(values, kind)
+        assert isinstance(result, bytearray)
+        assert result == expected
+
+    def test_validate_many_numpy(self):
+        numpy = pytest.importorskip('numpy')
+        values = numpy.array(['192.1.1.1', '192.1.1', '256.1.1.1'])
+        result = validate_many(values, 'ipv4')
+        assert result.dtype == numpy.bool_
+        assert result.tolist() == [True, False, False]
+
+    @pytest.mark.parametrize(
+        ('token', 'expected'),
+        (
+            ('', 0),
+            ('!', 0),
+            ('-12.5', re_pattern.TokenType.FLOAT_NUMBER),
+            (
+                '12345',
+                re_pattern.TokenType.FLOAT_NUMBER | re_pattern.TokenType.QQ_ID,
+            ),
+            (
+                '13800000000',
+                re_pattern.TokenType.FLOAT_NUMBER
+                | re_pattern.TokenType.QQ_ID
+                | re_pattern.TokenType.PHONE_CN,
+            ),
+            ('192.1.1.1', re_pattern.TokenType.IPV4),
+            ('abc@a.b', re_pattern.TokenType.EMAIL),
+            ('<br>', re_pattern.TokenType.HTML),
+            ('abc.org', re_pattern.TokenType.DOMAIN_NAME_EN),
+            (
+                '中文abc.ab',
+                re_pattern.TokenType.DOMAIN_NAME_CN,
+            ),
+            ('#ABC', re_pattern.TokenType.RGB_HEX),
+            ('湘A12345', re_pattern.TokenType.LICENSE_PLATE_CN),
+            (
+                'AB1234',
+                re_pattern.TokenType.LICENSE_PLATE_HK | re_pattern.TokenType.WX_ID,
+            ),
+            ('a_123a_123', re_pattern.TokenType.WX_ID),
+            ('43000000000000000X', re_pattern.TokenType.ID_CN),
+        ),
+    )
+    def test_classify(self, token: str, expected: int):
+        assert classify(token) == expected
+        assert isinstance(classify(token), re_pattern.TokenType)
+
+    def test_classify_max_len(self, domain_name_max_len_cn: int):
+        s = '中' * (domain_name_max_len_cn - len('.org') + 1) + '.org'
+        assert validate_domain_name(s[1:], re_pattern.LANGUAGE.CN)
+        assert classify(s[1:]) == re_pattern.TokenType.DOMAIN_NAME_CN
+        assert not classify(s)
+
+    def test_classify_many(self):
+        tokens = ['12345', '#ABC', 'abc@a.b', '!']
+        kinds = ('qq_id', 'rgb_hex')
+        assert classify_many(tokens).tolist() == [classify(t) for t in tokens]
+        assert classify_many(tokens, kinds).tolist() == [
+            re_pattern.TokenType.QQ_ID,
+            re_pattern.TokenType.RGB_HEX,
+            0,
+            0,
+        ]
+
     def test_ispunctuation(self):
         assert not ispunctuation('')
 
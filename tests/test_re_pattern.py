@@ -613,3 +613,44 @@ class TestRePattern:
         else:
             # not match
             assert m is None
+
+    def test_get_pattern(self):
+        for name in re_pattern.PATTERNS:
+            p = re_pattern.get_pattern(name)
+            assert isinstance(p, re.Pattern)
+            assert p is re_pattern.get_pattern(name)
+
+        with pytest.raises(KeyError):
+            re_pattern.get_pattern('no-such-pattern')
+
+    def test_compile_pattern(self):
+        p = re_pattern.compile_pattern(re_pattern.QQ_ID)
+        assert p is re_pattern.compile_pattern(re_pattern.QQ_ID)
+        assert p.fullmatch('12345')
+        assert not p.fullmatch('12345\n')
+
+        # 'ID_CN' relies on being wrapped with parentheses
+        p = re_pattern.compile_pattern(re_pattern.ID_CN)
+        assert p.fullmatch('123456789011111')
+        assert not p.fullmatch('1234567890111112')
+
+    def test_warm_patterns(self):
+        re_pattern.warm_patterns()
+        assert set(re_pattern._compiled_patterns) == set(re_pattern.PATTERNS)
+
+    def test_first_chars(self):
+        assert set(re_pattern.FIRST_CHARS) == set(re_pattern.PATTERNS)
+        for name, pattern in re_pattern.FIRST_CHARS.items():
+            p = re_pattern.compile_pattern(pattern, re_pattern.PATTERNS[name][1])
+            assert p.fullmatch('') is None
+
+    def test_token_type(self):
+        assert [t.name for t in re_pattern.TokenType] == [
+            name.upper() for name in re_pattern.PATTERNS
+        ]
+
+    def test_compile_classifier(self):
+        names = ('float_number', 'qq_id', 'email')
+        m = re_pattern.compile_classifier(names).match('12345')
+        assert m is not None
+        assert m.groupdict() == {'float_number': '12345', 'qq_id': '12345', 'email': None}